@@ -4,9 +4,10 @@ use ethers::{
     types::{Address, U256, H256, Transaction, BlockNumber},
     contract::abigen,
 };
-use std::{sync::Arc, time::Duration, collections::HashMap};
-use tokio::{sync::RwLock, time::interval};
-use redis::{AsyncCommands, Client as RedisClient};
+use std::{sync::Arc, time::Duration, collections::{HashMap, HashSet}};
+use tokio::{sync::{OnceCell, RwLock}, time::interval};
+use futures::stream::{self, StreamExt};
+use redis::{aio::ConnectionManager, AsyncCommands, Client as RedisClient};
 use serde::{Deserialize, Serialize};
 use anyhow::{Result, Context};
 
@@ -21,6 +22,16 @@ abigen!(
     "./abi/AavePool.json"
 );
 
+// Aave Pool liquidationCall(address,address,address,uint256,bool)
+const LIQUIDATION_CALL_SELECTOR: [u8; 4] = [0x00, 0xa7, 0x18, 0xa9];
+
+// Max in-flight getUserAccountData calls per scan
+const ACCOUNT_QUERY_CONCURRENCY: usize = 16;
+
+// Upper bound on opening the shared Redis connection (ConnectionManager
+// otherwise retries with backoff for ~12s while Redis is down)
+const REDIS_CONNECT_TIMEOUT: Duration = Duration::from_secs(1);
+
 #[derive(Debug, Clone, Serialize, Deserialize)]
 struct LiquidationTarget {
     protocol: String,
@@ -64,6 +75,7 @@ pub struct LiquidationBot {
     http_provider: Arc<Provider<Http>>,
     executor: LiquidationExecutor<Provider<Ws>>,
     redis: Arc<RedisClient>,
+    redis_conn: Arc<OnceCell<ConnectionManager>>,
     positions: Arc<RwLock<HashMap<Address, LiquidationTarget>>>,
     wallet: LocalWallet,
 }
@@ -89,7 +101,7 @@ impl LiquidationBot {
         ));
         let executor = LiquidationExecutor::new(config.executor_address, client);
         
-        // Connect to Redis
+        // Redis client; the shared connection is opened lazily on first use
         let redis = Arc::new(RedisClient::open(config.redis_url.as_str())?);
         
         Ok(Self {
@@ -98,6 +110,7 @@ impl LiquidationBot {
             http_provider,
             executor,
             redis,
+            redis_conn: Arc::new(OnceCell::new()),
             positions: Arc::new(RwLock::new(HashMap::new())),
             wallet,
         })
@@ -168,17 +181,56 @@ impl LiquidationBot {
         
         let logs = self.provider.get_logs(&filter).await?;
         
-        for log in logs {
-            let user = Address::from(log.topics[2]);
-            
-            // Get user account data via multicall
-            let account_data = self.get_aave_account_data(user).await?;
-            
-            if let Some(target) = self.evaluate_aave_position(user, account_data).await? {
-                self.positions.write().await.insert(user, target);
+        // The same user often borrows several times within the window;
+        // only look each one up once per scan
+        let users: HashSet<Address> = logs
+            .iter()
+            .map(|log| Address::from(log.topics[2]))
+            .collect();
+        
+        if users.is_empty() {
+            return Ok(());
+        }
+        
+        // Query accounts concurrently; each call is an independent RPC round trip
+        let results: Vec<(Address, Result<AccountData>)> = stream::iter(users)
+            .map(|user| async move { (user, self.get_aave_account_data(user).await) })
+            .buffer_unordered(ACCOUNT_QUERY_CONCURRENCY)
+            .collect()
+            .await;
+        
+        let mut underwater = Vec::new();
+        for (user, result) in results {
+            match result {
+                Ok(account_data) if account_data.health_factor < 1.0 => {
+                    underwater.push((user, account_data));
+                }
+                Ok(_) => {}
+                // One failed account (e.g. a rate-limited call) must not abort the scan
+                Err(e) => println!("⚠️ Skipping account {:?}: {:?}", user, e),
             }
         }
         
+        // Healthy scans make no gas RPC at all
+        if underwater.is_empty() {
+            return Ok(());
+        }
+        
+        // Quote gas once, after the account queries, and price every candidate against it
+        let gas_price = self.provider.get_gas_price().await?;
+        
+        let targets: Vec<LiquidationTarget> = underwater
+            .into_iter()
+            .filter_map(|(user, account_data)| {
+                self.evaluate_aave_position(user, account_data, gas_price)
+            })
+            .collect();
+        
+        let mut positions = self.positions.write().await;
+        for target in targets {
+            positions.insert(target.user, target);
+        }
+        
         Ok(())
     }
     
@@ -196,30 +248,32 @@ impl LiquidationBot {
             health_factor
         ) = pool.get_user_account_data(user).call().await?;
         
+        // Aave reports type(uint256).max for accounts without debt (e.g. fully
+        // repaid borrowers); as_u128() would panic on it
+        let health_factor = if health_factor > U256::from(u128::MAX) {
+            f64::INFINITY
+        } else {
+            health_factor.as_u128() as f64 / 1e18
+        };
+        
         Ok(AccountData {
             total_collateral,
             total_debt,
-            health_factor: health_factor.as_u128() as f64 / 1e18,
+            health_factor,
             liquidation_threshold,
         })
     }
     
-    // Evaluate if position is profitable to liquidate
-    async fn evaluate_aave_position(
+    // Evaluate if an underwater position (health factor < 1.0) is profitable to liquidate
+    fn evaluate_aave_position(
         &self,
         user: Address,
-        data: AccountData
-    ) -> Result<Option<LiquidationTarget>> {
-        if data.health_factor >= 1.0 {
-            return Ok(None);
-        }
-        
+        data: AccountData,
+        gas_price: U256,
+    ) -> Option<LiquidationTarget> {
         // Calculate maximum liquidation amount (50% of debt)
         let max_liquidation = data.total_debt / 2;
         
-        // Get current gas price
-        let gas_price = self.provider.get_gas_price().await?;
-        
         // Calculate expected profit
         let liquidation_bonus = U256::from(500); // 5% in basis points
         let collateral_value = max_liquidation * (10000 + liquidation_bonus) / 10000;
@@ -231,16 +285,16 @@ impl LiquidationBot {
         let total_cost = max_liquidation + flash_loan_fee + gas_cost;
         
         if collateral_value <= total_cost {
-            return Ok(None);
+            return None;
         }
         
         let expected_profit = collateral_value - total_cost;
         
         if expected_profit < self.config.min_profit_usd {
-            return Ok(None);
+            return None;
         }
         
-        Ok(Some(LiquidationTarget {
+        Some(LiquidationTarget {
             protocol: "AAVE_V3".to_string(),
             user,
             collateral_asset: Address::zero(), // Would need to determine actual asset
@@ -249,7 +303,7 @@ impl LiquidationBot {
             health_factor: data.health_factor,
             expected_profit,
             gas_price,
-        }))
+        })
     }
     
     // Monitor oracle price updates
@@ -264,7 +318,9 @@ impl LiquidationBot {
         let mut stream = self.provider.watch(&filter).await?;
         
         while let Some(log) = stream.next().await {
-            println!("📊 Oracle update detected: {:?}", log);
+            // Status line stays cheap; the full Log is only formatted at debug
+            tracing::info!("📊 Oracle update detected at block {:?}", log.block_number);
+            tracing::debug!("Oracle update log: {:?}", log);
             
             // Immediately check positions after oracle update
             self.scan_positions_after_oracle_update().await?;
@@ -306,7 +362,13 @@ impl LiquidationBot {
             match self.execute_liquidation_flashbots(target.clone()).await {
                 Ok(tx) => {
                     println!("✅ Liquidation submitted via Flashbots: {:?}", tx);
-                    self.track_execution(tx).await?;
+                    // Analytics only; record off the execution path so Redis can't stall the scan loop
+                    let bot = self.clone();
+                    tokio::spawn(async move {
+                        if let Err(e) = bot.track_execution(tx).await {
+                            println!("⚠️ Failed to track execution: {:?}", e);
+                        }
+                    });
                 }
                 Err(_) => {
                     // Fallback to regular execution
@@ -402,17 +464,35 @@ impl LiquidationBot {
     // Track execution results
     async fn track_execution(&self, tx_hash: H256) -> Result<()> {
         // Store in Redis for analysis
-        let mut conn = self.redis.get_async_connection().await?;
+        let mut conn = self.redis_connection().await?;
         
+        // Record the execution and bump counters in a single round trip
         let key = format!("liquidation:{}", tx_hash);
-        let _: () = conn.set_ex(key, tx_hash.to_string(), 86400).await?;
-        
-        // Increment counters
-        let _: () = conn.incr("stats:total_liquidations", 1).await?;
+        let _: () = redis::pipe()
+            .atomic()
+            .set_ex(key, tx_hash.to_string(), 86400).ignore()
+            .incr("stats:total_liquidations", 1).ignore()
+            .query_async(&mut conn)
+            .await?;
         
         Ok(())
     }
     
+    // Shared Redis connection, opened on first use. A failed or timed-out
+    // connect leaves the cell empty so the next caller retries.
+    async fn redis_connection(&self) -> redis::RedisResult<ConnectionManager> {
+        let init = self.redis_conn
+            .get_or_try_init(|| ConnectionManager::new((*self.redis).clone()));
+        
+        match tokio::time::timeout(REDIS_CONNECT_TIMEOUT, init).await {
+            Ok(conn) => conn.cloned(),
+            Err(_) => Err(redis::RedisError::from((
+                redis::ErrorKind::IoError,
+                "Redis connect timed out",
+            ))),
+        }
+    }
+    
     // Health monitoring
     async fn health_check(self) -> Result<()> {
         let mut interval = interval(Duration::from_secs(30));
@@ -432,8 +512,12 @@ impl LiquidationBot {
             }
             
             // Check Redis connectivity
-            if let Ok(mut conn) = self.redis.get_async_connection().await {
-                let _: () = conn.set_ex("health:check", "ok", 60).await?;
+            let result = match self.redis_connection().await {
+                Ok(mut conn) => conn.set_ex::<_, _, ()>("health:check", "ok", 60).await,
+                Err(e) => Err(e),
+            };
+            if let Err(e) = result {
+                println!("⚠️ Redis error: {:?}", e);
             }
         }
     }
@@ -441,17 +525,12 @@ impl LiquidationBot {
     // Analyze mempool transaction
     async fn analyze_transaction(&self, tx: Transaction) -> Result<()> {
         // Check if it's a liquidation transaction
-        if tx.to == Some(self.config.aave_pool) {
-            if let Some(input) = tx.input {
-                // Decode function selector (first 4 bytes)
-                let selector = &input[0..4];
-                
-                // liquidationCall selector: 0x00a718a9
-                if selector == [0x00, 0xa7, 0x18, 0xa9] {
-                    println!("🎯 Competitor liquidation detected!");
-                    // Could implement front-running logic here
-                }
-            }
+        // Anchored prefix match on the calldata; short inputs simply don't match
+        if tx.to == Some(self.config.aave_pool)
+            && tx.input.starts_with(&LIQUIDATION_CALL_SELECTOR)
+        {
+            println!("🎯 Competitor liquidation detected!");
+            // Could implement front-running logic here
         }
         
         Ok(())
@@ -476,6 +555,7 @@ impl Clone for LiquidationBot {
             http_provider: self.http_provider.clone(),
             executor: self.executor.clone(),
             redis: self.redis.clone(),
+            redis_conn: self.redis_conn.clone(),
             positions: self.positions.clone(),
             wallet: self.wallet.clone(),
         }
@@ -484,6 +564,11 @@ impl Clone for LiquidationBot {
 
 #[tokio::main]
 async fn main() -> Result<()> {
+    // Log level comes from RUST_LOG, defaulting to info when unset
+    let filter = tracing_subscriber::EnvFilter::try_from_default_env()
+        .unwrap_or_else(|_| tracing_subscriber::EnvFilter::new("info"));
+    tracing_subscriber::fmt().with_env_filter(filter).init();
+    
     // Load configuration
     let config = Config {
         primary_rpc: std::env::var("PRIMARY_RPC")?,
@@ -158,8 +158,7 @@ impl Metrics {
                 .observe(profit);
             
             // Update total profit
-            let current = self.profit_usd_total.get();
-            self.profit_usd_total.set(current + profit);
+            self.profit_usd_total.add(profit);
             
             // Update daily stats
             let mut stats = self.daily_stats.write().await;
@@ -179,11 +178,14 @@ impl Metrics {
                 });
             protocol_stats.liquidations += 1;
             protocol_stats.profit_usd += profit;
+            
+            stats.update_success_rate();
         } else {
             self.liquidations_failed.inc();
             
             let mut stats = self.daily_stats.write().await;
             stats.failed_attempts += 1;
+            stats.update_success_rate();
         }
         
         // Record gas usage
@@ -242,6 +244,14 @@ impl DailyStats {
             protocols: HashMap::new(),
         }
     }
+    
+    // Keep success rate current on every write so readers never recount
+    fn update_success_rate(&mut self) {
+        let attempts = self.liquidations_count + self.failed_attempts;
+        if attempts > 0 {
+            self.success_rate = self.liquidations_count as f64 / attempts as f64 * 100.0;
+        }
+    }
 }
 
 // HTTP server for Prometheus metrics
@@ -287,6 +297,8 @@ pub struct AlertManager {
     discord_webhook: Option<String>,
     email_config: Option<EmailConfig>,
     thresholds: AlertThresholds,
+    // Shared client so alerts reuse pooled keep-alive connections
+    http: reqwest::Client,
 }
 
 #[derive(Clone)]
@@ -330,6 +342,7 @@ impl AlertManager {
                 max_failed_consecutive: 5,
                 min_success_rate: 80.0,
             },
+            http: reqwest::Client::new(),
         }
     }
     
@@ -341,15 +354,18 @@ impl AlertManager {
             Utc::now().format("%Y-%m-%d %H:%M:%S UTC")
         );
         
-        // Send to Telegram
-        if let Some(bot) = &self.telegram_bot {
-            self.send_telegram(&bot, &formatted).await;
-        }
-        
-        // Send to Discord
-        if let Some(webhook) = &self.discord_webhook {
-            self.send_discord(webhook, &formatted).await;
-        }
+        // Send to Telegram and Discord concurrently; the channels are independent
+        let telegram = async {
+            if let Some(bot) = &self.telegram_bot {
+                self.send_telegram(bot, &formatted).await;
+            }
+        };
+        let discord = async {
+            if let Some(webhook) = &self.discord_webhook {
+                self.send_discord(webhook, &formatted).await;
+            }
+        };
+        tokio::join!(telegram, discord);
         
         // Log to console
         println!("{}", formatted);
@@ -367,7 +383,7 @@ impl AlertManager {
             "parse_mode": "Markdown"
         });
         
-        let _ = reqwest::Client::new()
+        let _ = self.http
             .post(&url)
             .json(&params)
             .send()
@@ -379,7 +395,7 @@ impl AlertManager {
             "content": message
         });
         
-        let _ = reqwest::Client::new()
+        let _ = self.http
             .post(webhook)
             .json(&params)
             .send()
@@ -389,8 +405,9 @@ impl AlertManager {
     pub async fn check_thresholds(&self, metrics: &Metrics) {
         let stats = metrics.get_daily_stats().await;
         
-        // Check success rate
-        if stats.success_rate < self.thresholds.min_success_rate {
+        // Check success rate (meaningless until something has been attempted today)
+        let attempts = stats.liquidations_count + stats.failed_attempts;
+        if attempts > 0 && stats.success_rate < self.thresholds.min_success_rate {
             self.send_alert(
                 AlertLevel::Warning,
                 &format!("Success rate dropped to {:.1}%", stats.success_rate)